@@ -8,8 +8,8 @@ mapping from each OCA0xx code to its upstream pylint-odoo name/id.
 """
 
 import ast
+import functools
 import re
-from collections import Counter
 from pathlib import Path
 from typing import Any, Optional
 from urllib.parse import urlparse, urlsplit
@@ -27,11 +27,13 @@ MANIFEST_DATA_KEYS = ["data", "demo", "demo_xml", "init_xml", "test", "update_xm
 MANIFEST_FILES = ("__manifest__.py", "__odoo__.py", "__openerp__.py", "__terp__.py")
 
 #: Cursor expressions whose commit()/execute() usage is checked.
-CURSOR_EXPRESSIONS = (
-    "cr",  # old api
-    "self._cr",  # new api
-    "self.cr",  # controllers and tests
-    "self.env.cr",
+CURSOR_EXPRESSIONS = frozenset(
+    {
+        "cr",  # old api
+        "self._cr",  # new api
+        "self.cr",  # controllers and tests
+        "self.env.cr",
+    }
 )
 
 #: Methods that must call super() when overridden.
@@ -81,31 +83,40 @@ PRINTF_PATTERN = re.compile(
 )
 
 
+def find_module_dir(filename: str) -> Optional[Path]:
+    """Directory of the Odoo module containing a file: its nearest parent with a manifest (None if none)."""
+    file_dir = Path(filename).resolve().parent
+    for parent in [file_dir, *file_dir.parents]:
+        if any((parent / manifest).is_file() for manifest in MANIFEST_FILES):
+            return parent
+    return None
+
+
 def get_func_name(func: ast.AST) -> str:
     """Return the called name for Name/Attribute nodes ('' otherwise)."""
-    if isinstance(func, ast.Name):
+    if type(func) is ast.Name:
         return func.id
-    if isinstance(func, ast.Attribute):
+    if type(func) is ast.Attribute:
         return func.attr
     return ""
 
 
 def get_str_value(node: ast.AST) -> Optional[str]:
     """Return the string value of a Constant or (best-effort) JoinedStr node."""
-    if isinstance(node, ast.Constant) and isinstance(node.value, str):
+    if type(node) is ast.Constant and isinstance(node.value, str):
         return node.value
-    if isinstance(node, ast.JoinedStr):
-        return "".join(value.value if isinstance(value, ast.Constant) else "{}" for value in node.values)
+    if type(node) is ast.JoinedStr:
+        return "".join(value.value if type(value) is ast.Constant else "{}" for value in node.values)
     return None
 
 
 def get_dotted_name(node: ast.AST) -> str:
     """Return 'self.env.cr' for an attribute chain of Names ('' if not one)."""
     parts = []
-    while isinstance(node, ast.Attribute):
+    while type(node) is ast.Attribute:
         parts.append(node.attr)
         node = node.value
-    if not isinstance(node, ast.Name):
+    if type(node) is not ast.Name:
         return ""
     parts.append(node.id)
     return ".".join(reversed(parts))
@@ -211,6 +222,49 @@ def validate_url(url: str) -> bool:
     return True
 
 
+def collect_super_calls(tree: ast.AST) -> frozenset[int]:
+    """Return the ids of the function nodes containing a super() call, at any depth.
+
+    One pass over the tree replaces an `ast.walk` per overridden method.
+    """
+    found: set[int] = set()
+    stack: list[tuple[ast.AST, tuple[int, ...]]] = [(tree, ())]
+    while stack:
+        node, functions = stack.pop()
+        if type(node) in (ast.FunctionDef, ast.AsyncFunctionDef):
+            functions = (*functions, id(node))
+        elif type(node) is ast.Call and type(node.func) is ast.Name and node.func.id == "super":
+            found.update(functions)
+        stack.extend((child, functions) for child in ast.iter_child_nodes(node))
+    return frozenset(found)
+
+
+#: Manifest version tail after the Odoo series: '.<major>.<minor>.<patch>'.
+MANIFEST_VERSION_TAIL_RE = re.compile(r"\d+\.\d+\.\d+$")
+
+
+@functools.lru_cache(maxsize=8)
+def odoo_series(valid_versions: tuple[Any, ...]) -> frozenset[str]:
+    """Set of the configured valid Odoo versions, as strings."""
+    return frozenset(str(v) for v in valid_versions)
+
+
+def manifest_version_pattern(valid_versions: tuple[Any, ...]) -> str:
+    """Regex a manifest version has to match, as quoted in OCA011 messages."""
+    alternatives = "|".join(re.escape(str(v)) for v in valid_versions)
+    return rf"^({alternatives})\.\d+\.\d+\.\d+$"
+
+
+def is_valid_manifest_version(version: str, valid_versions: tuple[Any, ...]) -> bool:
+    """Whether version matches manifest_version_pattern(valid_versions).
+
+    The series is everything before the last three components, so a set
+    lookup replaces trying each alternative of the regex in turn.
+    """
+    series = version.rsplit(".", 3)[0]
+    return series in odoo_series(valid_versions) and bool(MANIFEST_VERSION_TAIL_RE.match(version, len(series) + 1))
+
+
 def version2tuple(version: str) -> tuple[int, ...]:
     """Parse '19.0.1.0.0' into (19, 0, 1, 0, 0); raises ValueError if invalid."""
     return tuple(int(part) for part in version.split("."))
@@ -219,25 +273,30 @@ def version2tuple(version: str) -> tuple[int, ...]:
 class PrintChecker(BaseChecker):
     """Check for print statements (should use logger instead)."""
 
+    TRIGGER_RE = re.compile(r"\bprint\b")
+    CALL_FUNC_TYPES = (ast.Name,)
+
     def visit_Call(self, node: ast.Call):
         """Check for print() calls."""
-        if isinstance(node.func, ast.Name) and node.func.id == "print":
+        if type(node.func) is ast.Name and node.func.id == "print":
             self.add_diagnostic(
                 "OCA001",
                 "Print used. Use `logger` instead.",
                 node,
                 DiagnosticLevel.WARNING,
             )
-        self.generic_visit(node)
 
 
 class CommitChecker(BaseChecker):
     """Check for direct cr.commit() usage."""
 
+    TRIGGER_RE = re.compile(r"\bcommit\b")
+    CALL_FUNC_TYPES = (ast.Attribute,)
+
     def visit_Call(self, node: ast.Call):
         """Check for cr.commit() calls."""
         if (
-            isinstance(node.func, ast.Attribute)
+            type(node.func) is ast.Attribute
             and node.func.attr == "commit"
             and get_dotted_name(node.func.value) in CURSOR_EXPRESSIONS
         ):
@@ -248,7 +307,6 @@ class CommitChecker(BaseChecker):
                 node,
                 DiagnosticLevel.ERROR,
             )
-        self.generic_visit(node)
 
 
 class SQLInjectionChecker(BaseChecker):
@@ -260,30 +318,42 @@ class SQLInjectionChecker(BaseChecker):
     (self._table) and psycopg2.sql wrappers are allowed.
     """
 
+    TRIGGER_RE = re.compile(r"\bexecute(?:many)?\b")
+    CALL_FUNC_TYPES = (ast.Attribute,)
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
-        self._psycopg2_imported_names: set[str] = set()
+        self._module: Optional[ast.Module] = None
+        self._psycopg2_names: Optional[set[str]] = None
         self._function_stack: list[ast.AST] = []
 
     def visit_Module(self, node: ast.Module):
-        """Collect names imported from psycopg2 before checking calls."""
-        for stmt in ast.walk(node):
-            if isinstance(stmt, ast.ImportFrom):
-                if stmt.module and stmt.module.split(".")[0] == "psycopg2":
+        self._module = node
+
+    @property
+    def _psycopg2_imported_names(self) -> set[str]:
+        """Names imported from psycopg2 anywhere in the module (collected on first use)."""
+        if self._psycopg2_names is None:
+            self._psycopg2_names = set()
+            for stmt in ast.walk(self._module) if self._module is not None else ():
+                if type(stmt) is ast.ImportFrom:
+                    if stmt.module and stmt.module.split(".")[0] == "psycopg2":
+                        for alias in stmt.names:
+                            self._psycopg2_names.add(alias.asname or alias.name)
+                elif type(stmt) is ast.Import:
                     for alias in stmt.names:
-                        self._psycopg2_imported_names.add(alias.asname or alias.name)
-            elif isinstance(stmt, ast.Import):
-                for alias in stmt.names:
-                    if alias.name.split(".")[0] == "psycopg2":
-                        self._psycopg2_imported_names.add((alias.asname or alias.name).split(".")[0])
-        self.generic_visit(node)
+                        if alias.name.split(".")[0] == "psycopg2":
+                            self._psycopg2_names.add((alias.asname or alias.name).split(".")[0])
+        return self._psycopg2_names
 
     def visit_FunctionDef(self, node: ast.FunctionDef):
         self._function_stack.append(node)
-        self.generic_visit(node)
+
+    def leave_FunctionDef(self, node: ast.FunctionDef):
         self._function_stack.pop()
 
     visit_AsyncFunctionDef = visit_FunctionDef  # noqa: N815 - ast.NodeVisitor naming
+    leave_AsyncFunctionDef = leave_FunctionDef  # noqa: N815 - ast.NodeVisitor naming
 
     def visit_Call(self, node: ast.Call):
         """Check for execute()/executemany() calls with risky formatting."""
@@ -295,12 +365,11 @@ class SQLInjectionChecker(BaseChecker):
                 node,
                 DiagnosticLevel.ERROR,
             )
-        self.generic_visit(node)
 
     def _is_sql_injection_risky(self, node: ast.Call) -> bool:
         if not (
             node.args
-            and isinstance(node.func, ast.Attribute)
+            and type(node.func) is ast.Attribute
             and node.func.attr in ("execute", "executemany")
             and get_dotted_name(node.func.value) in CURSOR_EXPRESSIONS
             # cr.execute("select * from %s" % foo, [bar]) -> probably a good
@@ -317,12 +386,12 @@ class SQLInjectionChecker(BaseChecker):
         return any(self._node_risky(assigned) for assigned in self._assignation_nodes(first_arg))
 
     def _node_risky(self, node: ast.AST) -> bool:
-        if isinstance(node, ast.BinOp) and isinstance(node.op, (ast.Mod, ast.Add)):
-            if isinstance(node.right, ast.Tuple):
+        if type(node) is ast.BinOp and type(node.op) in (ast.Mod, ast.Add):
+            if type(node.right) is ast.Tuple:
                 # execute("..." % (self._table, thing))
                 if not all(map(self._allowable, node.right.elts)):
                     return True
-            elif isinstance(node.right, ast.Dict):
+            elif type(node.right) is ast.Dict:
                 # execute("..." % {'table': self._table})
                 if not all(self._allowable(v) for v in node.right.values):
                     return True
@@ -334,14 +403,14 @@ class SQLInjectionChecker(BaseChecker):
                 return True
 
         # execute("...".format(self._table, table=self._table)); sql.SQL().format is OK
-        if isinstance(node, ast.Call) and isinstance(node.func, ast.Attribute) and node.func.attr == "format":
+        if type(node) is ast.Call and type(node.func) is ast.Attribute and node.func.attr == "format":
             if not all(map(self._allowable, node.args or [])):
                 return True
             if not all(self._allowable(keyword.value) for keyword in (node.keywords or [])):
                 return True
 
         # f-strings
-        if isinstance(node, ast.JoinedStr):
+        if type(node) is ast.JoinedStr:
             return not all(self._allowable(value) for value in node.values)
 
         return False
@@ -350,25 +419,25 @@ class SQLInjectionChecker(BaseChecker):
         # sql.SQL or sql.Identifier is OK
         if self._is_psycopg2_sql(node):
             return True
-        if isinstance(node, ast.FormattedValue):
+        if type(node) is ast.FormattedValue:
             return self._allowable(node.value)
-        if isinstance(node, ast.Call):
+        if type(node) is ast.Call:
             node = node.func
         # self._thing is OK (mostly self._table), self._thing() also because
         # it's a common pattern of reports (self._select, self._group_by, ...)
         return (
-            isinstance(node, ast.Attribute)
-            and isinstance(node.value, ast.Name)
+            type(node) is ast.Attribute
+            and type(node.value) is ast.Name
             and node.attr.startswith("_")
             # cr.execute('SELECT * FROM %s' % 'table') is OK: constants
             # can not be injected
-            or isinstance(node, ast.Constant)
+            or type(node) is ast.Constant
         )
 
     def _is_psycopg2_sql(self, node: ast.AST) -> bool:
-        if isinstance(node, ast.Name):
+        if type(node) is ast.Name:
             return any(self._is_psycopg2_sql(assigned) for assigned in self._assignation_nodes(node))
-        if not isinstance(node, ast.Call) or not isinstance(node.func, (ast.Attribute, ast.Name)):
+        if type(node) is not ast.Call or type(node.func) not in (ast.Attribute, ast.Name):
             return False
         dotted = get_dotted_name(node.func) or get_func_name(node.func)
         imported_name = dotted.split(".")[0]
@@ -376,7 +445,7 @@ class SQLInjectionChecker(BaseChecker):
 
     def _assignation_nodes(self, node: ast.AST):
         """Yield values assigned to this Name/Subscript in the current function."""
-        if not isinstance(node, (ast.Name, ast.Subscript)) or not self._function_stack:
+        if type(node) not in (ast.Name, ast.Subscript) or not self._function_stack:
             return
         try:
             node_repr = ast.unparse(node)
@@ -384,9 +453,9 @@ class SQLInjectionChecker(BaseChecker):
             return
         for stmt in ast.walk(self._function_stack[-1]):
             if (
-                isinstance(stmt, ast.Assign)
+                type(stmt) is ast.Assign
                 and stmt.targets
-                and isinstance(stmt.targets[0], (ast.Name, ast.Subscript))
+                and type(stmt.targets[0]) in (ast.Name, ast.Subscript)
                 and ast.unparse(stmt.targets[0]) == node_repr
             ):
                 yield stmt.value
@@ -395,6 +464,9 @@ class SQLInjectionChecker(BaseChecker):
 class ImportChecker(BaseChecker):
     """Check for Odoo-specific import issues."""
 
+    #: odoo.addons imports, odoo.exceptions.Warning
+    TRIGGER_RE = re.compile(r"\b(?:addons|Warning)\b")
+
     def visit_Import(self, node: ast.Import):
         """Check `import odoo.addons.module` style imports."""
         imported = set()
@@ -403,7 +475,6 @@ class ImportChecker(BaseChecker):
             if len(parts) >= 3 and parts[0] == "odoo" and parts[1] == "addons":
                 imported.add(parts[2])
         self._check_same_module_import(node, imported)
-        self.generic_visit(node)
 
     def visit_ImportFrom(self, node: ast.ImportFrom):
         """Check imports."""
@@ -432,12 +503,10 @@ class ImportChecker(BaseChecker):
                             DiagnosticLevel.REFACTOR,
                         )
 
-        self.generic_visit(node)
-
     def _check_same_module_import(self, node: ast.AST, imported_modules: set[str]):
         if not imported_modules:
             return
-        module_name = self._odoo_module_name()
+        module_name = self._odoo_module_name
         if module_name and module_name in imported_modules:
             self.add_diagnostic(
                 "OCA004",
@@ -447,8 +516,12 @@ class ImportChecker(BaseChecker):
                 DiagnosticLevel.WARNING,
             )
 
+    @functools.cached_property
     def _odoo_module_name(self) -> str:
-        """Name of the Odoo module containing this file ('' if none applies)."""
+        """Name of the Odoo module containing this file ('' if none applies).
+
+        Resolved once per file: it stats the parent directories for a manifest.
+        """
         file_dir = Path(self.filename).resolve().parent
         # Migration scripts legitimately import their own module absolutely
         if file_dir.parent.name == "migrations":
@@ -456,15 +529,17 @@ class ImportChecker(BaseChecker):
         # Test files are only loaded when the module is installed
         if file_dir.name == "tests":
             return ""
-        for parent in [file_dir, *file_dir.parents]:
-            if any((parent / manifest).is_file() for manifest in MANIFEST_FILES):
-                return parent.name
-        return ""
+        module_dir = find_module_dir(self.filename)
+        return module_dir.name if module_dir is not None else ""
 
 
 class MethodChecker(BaseChecker):
     """Check Odoo method naming conventions and required super() calls."""
 
+    #: fields.X(compute=...), methods overridden in classes
+    TRIGGER_RE = re.compile(r"\b(?:fields|class)\b")
+    CALL_FUNC_TYPES = (ast.Name, ast.Attribute)
+
     #: field keyword -> (code, expected method name prefix)
     FIELD_METHOD_KEYWORDS = {
         "compute": ("OCA006", "_compute_"),
@@ -472,20 +547,30 @@ class MethodChecker(BaseChecker):
         "search": ("OCA035", "_search_"),
     }
 
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._module: Optional[ast.Module] = None
+        self._super_fn_ids: Optional[frozenset[int]] = None
+
+    def visit_Module(self, node: ast.Module):
+        self._module = node
+
     def visit_ClassDef(self, node: ast.ClassDef):
         """Check methods that must call super()."""
-        for method in node.body:
-            if isinstance(method, (ast.FunctionDef, ast.AsyncFunctionDef)) and method.name in METHOD_REQUIRED_SUPER:
-                self._check_method_super(method)
-        self.generic_visit(node)
+        methods = [
+            method
+            for method in node.body
+            if type(method) in (ast.FunctionDef, ast.AsyncFunctionDef) and method.name in METHOD_REQUIRED_SUPER
+        ]
+        if methods and self._super_fn_ids is None:
+            # One pass over the module, only for files that override such a method
+            self._super_fn_ids = collect_super_calls(self._module if self._module is not None else node)
+        for method in methods:
+            self._check_method_super(method)
 
     def visit_Call(self, node: ast.Call):
         """Check compute/inverse/search method names in field definitions."""
-        if (
-            isinstance(node.func, ast.Attribute)
-            and isinstance(node.func.value, ast.Name)
-            and node.func.value.id == "fields"
-        ):
+        if type(node.func) is ast.Attribute and type(node.func.value) is ast.Name and node.func.value.id == "fields":
             for keyword in node.keywords:
                 spec = self.FIELD_METHOD_KEYWORDS.get(keyword.arg or "")
                 value = get_str_value(keyword.value) if spec else None
@@ -496,13 +581,11 @@ class MethodChecker(BaseChecker):
                         keyword.value,
                         DiagnosticLevel.CONVENTION,
                     )
-        self.generic_visit(node)
 
     def _check_method_super(self, node: ast.FunctionDef):
         """Check if the method calls super()."""
-        for child in ast.walk(node):
-            if isinstance(child, ast.Call) and isinstance(child.func, ast.Name) and child.func.id == "super":
-                return
+        if id(node) in self._super_fn_ids:
+            return
         self.add_diagnostic(
             "OCA007",
             f'Missing `super` call in "{node.name}" method.',
@@ -514,6 +597,9 @@ class MethodChecker(BaseChecker):
 class TranslationChecker(BaseChecker):
     """Check for translation-related issues in odoo._ / odoo._lt calls."""
 
+    TRIGGER_RE = re.compile(r"\b(?:raise|message_post|_|_lt)\b")
+    CALL_FUNC_TYPES = (ast.Name, ast.Attribute)
+
     def visit_Call(self, node: ast.Call):
         """Check translation calls."""
         func_name = get_func_name(node.func)
@@ -521,8 +607,8 @@ class TranslationChecker(BaseChecker):
         # _('...').format(...) -> translation-format-interpolation
         if (
             func_name == "format"
-            and isinstance(node.func, ast.Attribute)
-            and isinstance(node.func.value, ast.Call)
+            and type(node.func) is ast.Attribute
+            and type(node.func.value) is ast.Call
             and get_func_name(node.func.value.func) in TRANSLATION_METHODS
         ):
             self.add_diagnostic(
@@ -539,19 +625,15 @@ class TranslationChecker(BaseChecker):
         # message_post(body='literal') -> translation-required
         if (
             func_name == "message_post"
-            and isinstance(node.func, ast.Attribute)
+            and type(node.func) is ast.Attribute
             and Path(self.filename).resolve().parent.name != "tests"
         ):
             self._check_message_post(node)
 
         # fields.X(..., string=_('...')) -> translation-field
-        if (
-            isinstance(node.func, ast.Attribute)
-            and isinstance(node.func.value, ast.Name)
-            and node.func.value.id == "fields"
-        ):
+        if type(node.func) is ast.Attribute and type(node.func.value) is ast.Name and node.func.value.id == "fields":
             for argument in list(node.args) + [kw.value for kw in node.keywords]:
-                if isinstance(argument, ast.Call) and get_func_name(argument.func) in TRANSLATION_METHODS:
+                if type(argument) is ast.Call and get_func_name(argument.func) in TRANSLATION_METHODS:
                     self.add_diagnostic(
                         "OCA026",
                         'Translation method _("string") in fields is not necessary.',
@@ -559,13 +641,11 @@ class TranslationChecker(BaseChecker):
                         DiagnosticLevel.WARNING,
                     )
 
-        self.generic_visit(node)
-
     def visit_BinOp(self, node: ast.BinOp):
         """Check _('...') % values -> interpolation after (outside) translation."""
         if (
-            isinstance(node.op, ast.Mod)
-            and isinstance(node.left, ast.Call)
+            type(node.op) is ast.Mod
+            and type(node.left) is ast.Call
             and get_func_name(node.left.func) in TRANSLATION_METHODS
             and self._odoo_version_at_least((14, 0))
         ):
@@ -576,12 +656,11 @@ class TranslationChecker(BaseChecker):
                 node,
                 DiagnosticLevel.WARNING,
             )
-        self.generic_visit(node)
 
     def _check_message_post(self, node: ast.Call):
         """Check message_post() body/subject values are translated."""
         for arg in list(node.args) + list(node.keywords):
-            if isinstance(arg, ast.keyword):
+            if type(arg) is ast.keyword:
                 keyword = arg.arg or ""
                 value = arg.value
             else:
@@ -591,32 +670,32 @@ class TranslationChecker(BaseChecker):
                 continue
             as_string = ""
             # case: message_post(body='String')
-            if isinstance(value, ast.JoinedStr) or (isinstance(value, ast.Constant) and isinstance(value.value, str)):
+            if type(value) is ast.JoinedStr or (type(value) is ast.Constant and isinstance(value.value, str)):
                 as_string = ast.unparse(value)
             # case: message_post(body='String %s' % (...))
             elif (
-                isinstance(value, ast.BinOp)
-                and isinstance(value.op, ast.Mod)
+                type(value) is ast.BinOp
+                and type(value.op) is ast.Mod
                 and (
-                    isinstance(value.left, ast.JoinedStr)
-                    or (isinstance(value.left, ast.Constant) and isinstance(value.left.value, str))
+                    type(value.left) is ast.JoinedStr
+                    or (type(value.left) is ast.Constant and isinstance(value.left.value, str))
                 )
                 # The right part is translatable only if it is a
                 # function or a list of functions
                 and not (
-                    isinstance(value.right, (ast.Call, ast.Tuple, ast.List))
-                    and all(isinstance(child, ast.Call) for child in getattr(value.right, "elts", []))
+                    type(value.right) in (ast.Call, ast.Tuple, ast.List)
+                    and all(type(child) is ast.Call for child in getattr(value.right, "elts", []))
                 )
             ):
                 as_string = ast.unparse(value.left)
             # case: message_post(body='String {...}'.format(...))
             elif (
-                isinstance(value, ast.Call)
-                and isinstance(value.func, ast.Attribute)
+                type(value) is ast.Call
+                and type(value.func) is ast.Attribute
                 and value.func.attr == "format"
                 and (
-                    isinstance(value.func.value, ast.JoinedStr)
-                    or (isinstance(value.func.value, ast.Constant) and isinstance(value.func.value.value, str))
+                    type(value.func.value) is ast.JoinedStr
+                    or (type(value.func.value) is ast.Constant and isinstance(value.func.value.value, str))
                 )
             ):
                 as_string = ast.unparse(value.func.value)
@@ -634,15 +713,11 @@ class TranslationChecker(BaseChecker):
     def visit_Raise(self, node: ast.Raise):
         """Check raise UserError('literal') -> translation-required."""
         expr = node.exc
-        if isinstance(expr, ast.Call) and expr.args and get_func_name(expr.func) in self.config.odoo_exceptions:
+        if type(expr) is ast.Call and expr.args and get_func_name(expr.func) in self.config.odoo_exceptions:
             argument = expr.args[0]
-            if (
-                isinstance(argument, ast.Call)
-                and isinstance(argument.func, ast.Attribute)
-                and argument.func.attr == "format"
-            ):
+            if type(argument) is ast.Call and type(argument.func) is ast.Attribute and argument.func.attr == "format":
                 argument = argument.func.value
-            elif isinstance(argument, ast.BinOp):
+            elif type(argument) is ast.BinOp:
                 argument = argument.left
             if get_str_value(argument) is not None:
                 exc_name = get_func_name(expr.func)
@@ -653,7 +728,6 @@ class TranslationChecker(BaseChecker):
                     node,
                     DiagnosticLevel.CONVENTION,
                 )
-        self.generic_visit(node)
 
     def _odoo_version_at_least(self, minimum: tuple[int, int]) -> bool:
         """True when the newest configured Odoo version is >= minimum."""
@@ -670,7 +744,7 @@ class TranslationChecker(BaseChecker):
     def _check_translation_call(self, node: ast.Call):
         """Run all checks on a _(...) / _lt(...) call."""
         # prefer-env-translation (Odoo >= 18 only): bare _() instead of self.env._()
-        if isinstance(node.func, ast.Name) and self._odoo_version_at_least((18, 0)):
+        if type(node.func) is ast.Name and self._odoo_version_at_least((18, 0)):
             self.add_diagnostic(
                 "OCA033",
                 "Better using self.env._ More info at https://github.com/odoo/odoo/pull/174844",
@@ -681,7 +755,7 @@ class TranslationChecker(BaseChecker):
         arg = node.args[0]
 
         # translation-fstring-interpolation: _(f"...")
-        if isinstance(arg, ast.JoinedStr):
+        if type(arg) is ast.JoinedStr:
             self.add_diagnostic(
                 "OCA028",
                 "Use of f-string inside odoo._. The translation lookup happens on the "
@@ -691,7 +765,7 @@ class TranslationChecker(BaseChecker):
             )
 
         # translation-not-lazy + translation-contains-variable: _('...' % values)
-        if isinstance(arg, ast.BinOp) and isinstance(arg.op, ast.Mod):
+        if type(arg) is ast.BinOp and type(arg.op) is ast.Mod:
             if self._odoo_version_at_least((14, 0)):
                 self.add_diagnostic(
                     "OCA008",
@@ -710,10 +784,10 @@ class TranslationChecker(BaseChecker):
             )
         # translation-format-interpolation + contains-variable: _('...'.format(...))
         elif (
-            isinstance(arg, ast.Call)
-            and isinstance(arg.func, ast.Attribute)
+            type(arg) is ast.Call
+            and type(arg.func) is ast.Attribute
             and arg.func.attr == "format"
-            and isinstance(arg.func.value, ast.Constant)
+            and type(arg.func.value) is ast.Constant
         ):
             self.add_diagnostic(
                 "OCA027",
@@ -737,7 +811,7 @@ class TranslationChecker(BaseChecker):
         # translation-positional-used: multiple positional placeholders.
         # Like upstream, this looks at the source text of the whole first
         # argument, so `_('%s %s' % (a, b))` also counts.
-        if isinstance(arg, ast.Constant) and isinstance(arg.value, str):
+        if type(arg) is ast.Constant and isinstance(arg.value, str):
             str2translate = arg.value
         else:
             try:
@@ -755,7 +829,7 @@ class TranslationChecker(BaseChecker):
                 DiagnosticLevel.WARNING,
             )
 
-        if not (isinstance(arg, ast.Constant) and isinstance(arg.value, str)):
+        if not (type(arg) is ast.Constant and isinstance(arg.value, str)):
             return
         fmt = arg.value
         printf_count, printf_keys, printf_error = parse_printf(fmt)
@@ -810,28 +884,27 @@ class ManifestChecker(BaseChecker):
         if manifest_node is None:
             return
 
-        manifest_dict = self._dict_to_python(manifest_node)
+        # Index the value nodes by key; a value is only evaluated by the checks
+        # reading it, so big data/depends lists are never materialized.
+        manifest: dict[str, ast.AST] = {}
         self._key_nodes: dict[str, ast.AST] = {}
-        self._value_nodes: dict[str, ast.AST] = {}
         for key, value in zip(manifest_node.keys, manifest_node.values):
-            if isinstance(key, ast.Constant) and isinstance(key.value, str):
+            if type(key) is ast.Constant and isinstance(key.value, str) and key.value:
                 self._key_nodes[key.value] = key
-                self._value_nodes[key.value] = value
-
-        self._check_required_keys(manifest_dict, node)
-        self._check_deprecated_keys(manifest_dict, node)
-        self._check_license(manifest_dict, node)
-        self._check_version_format(manifest_dict, node)
-        self._check_author(manifest_dict, node)
-        self._check_development_status(manifest_dict, node)
-        self._check_maintainers(manifest_dict, node)
-        self._check_data_files(manifest_dict, node)
-        self._check_behind_migrations(manifest_dict, node)
-        self._check_external_assets(manifest_dict, node)
-        self._check_missing_readme(manifest_dict, node)
-        self._check_website(manifest_dict, node)
-
-        self.generic_visit(node)
+                manifest[key.value] = value
+
+        self._check_required_keys(manifest, node)
+        self._check_deprecated_keys(manifest, node)
+        self._check_license(manifest, node)
+        self._check_version_format(manifest, node)
+        self._check_author(manifest, node)
+        self._check_development_status(manifest, node)
+        self._check_maintainers(manifest, node)
+        self._check_data_files(manifest, node)
+        self._check_behind_migrations(manifest, node)
+        self._check_external_assets(manifest, node)
+        self._check_missing_readme(manifest, node)
+        self._check_website(manifest, node)
 
     def _key_node(self, key: str, default: ast.AST) -> ast.AST:
         """Node of the manifest key for diagnostics, or the given default."""
@@ -844,38 +917,32 @@ class ManifestChecker(BaseChecker):
     def _find_manifest_dict_node(self, node: ast.Module) -> Optional[ast.Dict]:
         """Find the manifest dictionary AST node."""
         for item in node.body:
-            if isinstance(item, ast.Assign):
-                if isinstance(item.value, ast.Dict):
+            if type(item) is ast.Assign:
+                if type(item.value) is ast.Dict:
                     for target in item.targets:
-                        if isinstance(target, ast.Name):
+                        if type(target) is ast.Name:
                             return item.value
-            elif isinstance(item, ast.Expr) and isinstance(item.value, ast.Dict):
+            elif type(item) is ast.Expr and type(item.value) is ast.Dict:
                 # Standalone dict (common in manifest files)
                 return item.value
         return None
 
-    def _dict_to_python(self, node: ast.Dict) -> dict[str, Any]:
-        """Convert AST Dict to Python dict."""
-        result = {}
-        for key, value in zip(node.keys, node.values):
-            if key is None:
-                continue
-            key_name = self._get_constant_value(key)
-            if key_name:
-                result[key_name] = self._get_constant_value(value)
-        return result
-
-    def _get_constant_value(self, node: ast.AST) -> Any:
+    def _get_constant_value(self, node: Optional[ast.AST]) -> Any:
         """Get constant value from AST node."""
-        if isinstance(node, ast.Constant):
+        if type(node) is ast.Constant:
             return node.value
-        if isinstance(node, (ast.List, ast.Tuple)):
+        if type(node) in (ast.List, ast.Tuple):
             return [self._get_constant_value(elt) for elt in node.elts]
-        if isinstance(node, ast.Dict):
-            return self._dict_to_python(node)
+        if type(node) is ast.Dict:
+            result = {}
+            for key, value in zip(node.keys, node.values):
+                key_name = self._get_constant_value(key)
+                if key_name:
+                    result[key_name] = self._get_constant_value(value)
+            return result
         return None
 
-    def _check_required_keys(self, manifest: dict[str, Any], node: ast.AST):
+    def _check_required_keys(self, manifest: dict[str, ast.AST], node: ast.AST):
         """Check for required manifest keys."""
         for key in self.config.manifest_required_keys:
             if key not in manifest:
@@ -886,7 +953,7 @@ class ManifestChecker(BaseChecker):
                     DiagnosticLevel.CONVENTION,
                 )
 
-    def _check_deprecated_keys(self, manifest: dict[str, Any], node: ast.AST):
+    def _check_deprecated_keys(self, manifest: dict[str, ast.AST], node: ast.AST):
         """Check for deprecated manifest keys."""
         for key in self.config.manifest_deprecated_keys:
             if key in manifest:
@@ -897,9 +964,9 @@ class ManifestChecker(BaseChecker):
                     DiagnosticLevel.CONVENTION,
                 )
 
-    def _check_license(self, manifest: dict[str, Any], node: ast.AST):
+    def _check_license(self, manifest: dict[str, ast.AST], node: ast.AST):
         """Check if license is allowed."""
-        license_value = manifest.get("license")
+        license_value = self._get_constant_value(manifest.get("license"))
         if license_value and license_value not in self.config.license_allowed:
             self.add_diagnostic(
                 "OCA010",
@@ -908,13 +975,13 @@ class ManifestChecker(BaseChecker):
                 DiagnosticLevel.CONVENTION,
             )
 
-    def _check_version_format(self, manifest: dict[str, Any], node: ast.AST):
+    def _check_version_format(self, manifest: dict[str, ast.AST], node: ast.AST):
         """Check version format against the configured valid Odoo versions."""
-        version = manifest.get("version")
+        version = self._get_constant_value(manifest.get("version"))
         if version:
-            valid_versions = "|".join(re.escape(str(v)) for v in self.config.valid_odoo_versions)
-            pattern = rf"^({valid_versions})\.\d+\.\d+\.\d+$"
-            if not re.match(pattern, str(version)):
+            valid_versions = tuple(self.config.valid_odoo_versions)
+            if not is_valid_manifest_version(str(version), valid_versions):
+                pattern = manifest_version_pattern(valid_versions)
                 self.add_diagnostic(
                     "OCA011",
                     f'Wrong Version Format "{version}" in manifest file. Regex to match: "{pattern}"',
@@ -922,9 +989,9 @@ class ManifestChecker(BaseChecker):
                     DiagnosticLevel.CONVENTION,
                 )
 
-    def _check_author(self, manifest: dict[str, Any], node: ast.AST):
+    def _check_author(self, manifest: dict[str, ast.AST], node: ast.AST):
         """Check author field."""
-        author = manifest.get("author")
+        author = self._get_constant_value(manifest.get("author"))
 
         # Check if author is a string
         if author and not isinstance(author, str):
@@ -949,9 +1016,9 @@ class ManifestChecker(BaseChecker):
                     DiagnosticLevel.CONVENTION,
                 )
 
-    def _check_development_status(self, manifest: dict[str, Any], node: ast.AST):
+    def _check_development_status(self, manifest: dict[str, ast.AST], node: ast.AST):
         """Check development_status field."""
-        dev_status = manifest.get("development_status")
+        dev_status = self._get_constant_value(manifest.get("development_status"))
         if dev_status and dev_status not in self.config.development_status_allowed:
             allowed_statuses = ", ".join(self.config.development_status_allowed)
             self.add_diagnostic(
@@ -961,9 +1028,9 @@ class ManifestChecker(BaseChecker):
                 DiagnosticLevel.CONVENTION,
             )
 
-    def _check_maintainers(self, manifest: dict[str, Any], node: ast.AST):
+    def _check_maintainers(self, manifest: dict[str, ast.AST], node: ast.AST):
         """Check maintainers key is a list of strings."""
-        maintainers = manifest.get("maintainers")
+        maintainers = self._get_constant_value(manifest.get("maintainers"))
         if maintainers and (
             not isinstance(maintainers, list) or any(not isinstance(item, str) for item in maintainers)
         ):
@@ -974,23 +1041,19 @@ class ManifestChecker(BaseChecker):
                 DiagnosticLevel.ERROR,
             )
 
-    def _check_data_files(self, manifest: dict[str, Any], node: ast.AST):
+    def _check_data_files(self, manifest: dict[str, ast.AST], node: ast.AST):
         """Check duplicated and missing data files (data/demo/... keys)."""
         module_dir = self._module_dir()
         for key in MANIFEST_DATA_KEYS:
-            if key not in manifest:
-                continue
-            value_node = self._value_nodes.get(key)
+            value_node = manifest.get(key)
             resource_nodes: dict[str, list[ast.AST]] = {}
-            if isinstance(value_node, (ast.List, ast.Tuple)):
+            if type(value_node) in (ast.List, ast.Tuple):
                 for elt in value_node.elts:
-                    if isinstance(elt, ast.Constant) and isinstance(elt.value, str):
+                    if type(elt) is ast.Constant and isinstance(elt.value, str):
                         resource_nodes.setdefault(elt.value, []).append(elt)
-            resources = [r for r in (manifest.get(key) or []) if isinstance(r, str)]
-            for resource, coincidences in Counter(resources).items():
-                nodes_for_resource = resource_nodes.get(resource) or [node]
+            for resource, nodes_for_resource in resource_nodes.items():
                 first_node = nodes_for_resource[0]
-                if coincidences >= 2:
+                if len(nodes_for_resource) >= 2:
                     lines_str = ", ".join(str(getattr(n, "lineno", "?")) for n in nodes_for_resource[1:])
                     self.add_diagnostic(
                         "OCA017",
@@ -1006,9 +1069,9 @@ class ManifestChecker(BaseChecker):
                         DiagnosticLevel.ERROR,
                     )
 
-    def _check_behind_migrations(self, manifest: dict[str, Any], node: ast.AST):
+    def _check_behind_migrations(self, manifest: dict[str, ast.AST], node: ast.AST):
         """Check the manifest version is not behind the migration scripts."""
-        version = manifest.get("version")
+        version = self._get_constant_value(manifest.get("version"))
         if not version:
             return
         migrations_dir = self._module_dir() / "migrations"
@@ -1034,10 +1097,10 @@ class ManifestChecker(BaseChecker):
                 )
                 break
 
-    def _check_external_assets(self, manifest: dict[str, Any], node: ast.AST):
+    def _check_external_assets(self, manifest: dict[str, ast.AST], node: ast.AST):
         """Check no assets are loaded from external URLs."""
-        assets_node = self._value_nodes.get("assets")
-        if not isinstance(assets_node, ast.Dict):
+        assets_node = manifest.get("assets")
+        if type(assets_node) is not ast.Dict:
             return
 
         def is_external_url(url: Any) -> bool:
@@ -1045,7 +1108,7 @@ class ManifestChecker(BaseChecker):
 
         for bundle_value in assets_node.values:
             for element in getattr(bundle_value, "elts", []):
-                if isinstance(element, ast.Constant) and is_external_url(element.value):
+                if type(element) is ast.Constant and is_external_url(element.value):
                     self.add_diagnostic(
                         "OCA019",
                         f"Asset {element.value} should be distributed with module's source code. "
@@ -1053,9 +1116,9 @@ class ManifestChecker(BaseChecker):
                         element,
                         DiagnosticLevel.WARNING,
                     )
-                elif isinstance(element, (ast.Tuple, ast.List)):
+                elif type(element) in (ast.Tuple, ast.List):
                     for entry in element.elts:
-                        if isinstance(entry, ast.Constant) and is_external_url(entry.value):
+                        if type(entry) is ast.Constant and is_external_url(entry.value):
                             self.add_diagnostic(
                                 "OCA019",
                                 f"Asset {entry.value} should be distributed with module's source code. "
@@ -1064,7 +1127,7 @@ class ManifestChecker(BaseChecker):
                                 DiagnosticLevel.WARNING,
                             )
 
-    def _check_missing_readme(self, manifest: dict[str, Any], node: ast.AST):
+    def _check_missing_readme(self, manifest: dict[str, ast.AST], node: ast.AST):
         """Check a README file exists next to the manifest."""
         module_dir = self._module_dir()
         if not any((module_dir / readme).is_file() for readme in README_FILES):
@@ -1075,9 +1138,9 @@ class ManifestChecker(BaseChecker):
                 DiagnosticLevel.CONVENTION,
             )
 
-    def _check_website(self, manifest: dict[str, Any], node: ast.AST):
+    def _check_website(self, manifest: dict[str, ast.AST], node: ast.AST):
         """Check the website key is a valid URI."""
-        website = manifest.get("website") or ""
+        website = self._get_constant_value(manifest.get("website")) or ""
         if not isinstance(website, str):
             return
         msg = ""
@@ -6,6 +6,7 @@ from pathlib import Path
 
 from . import __version__
 from .config import Config
+from .diagnostic import DiagnosticLevel
 from .formatters import get_formatter
 from .linter import Linter
 
@@ -35,6 +36,18 @@ def main():
         default=None,
         help="Output format (default: text)",
     )
+    check_parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=None,
+        help="Number of parallel worker processes, 0 for one per CPU (default: 0)",
+    )
+    check_parser.add_argument(
+        "--cache-dir",
+        default=None,
+        help="Cache lint results of unchanged files in this directory (default: no cache)",
+    )
     check_parser.add_argument(
         "--config",
         type=Path,
@@ -57,6 +70,8 @@ def main():
             args.command = "check"
             args.paths = sys.argv[1:]
             args.format = None
+            args.jobs = None
+            args.cache_dir = None
             args.config = None
             args.no_config = False
         else:
@@ -81,20 +96,25 @@ def run_check(args):
     # Override format if specified in CLI
     if args.format:
         config.output_format = args.format
+    if args.jobs is not None:
+        if args.jobs < 0:
+            print(f"Error: --jobs must be 0 or greater, got {args.jobs}", file=sys.stderr)
+            return 1
+        config.jobs = args.jobs
+    if args.cache_dir:
+        config.cache_dir = args.cache_dir
 
     # Create linter
     linter = Linter(config)
 
-    # Collect all diagnostics
-    all_diagnostics = []
-    for path_str in args.paths:
-        path = Path(path_str)
+    # Collect all diagnostics, linting every path in one batch
+    paths = [Path(path_str) for path_str in args.paths]
+    for path in paths:
         if not path.exists():
             print(f"Error: Path does not exist: {path}", file=sys.stderr)
             return 1
 
-        diagnostics = linter.lint_path(path)
-        all_diagnostics.extend(diagnostics)
+    all_diagnostics = linter.lint_paths(paths)
 
     # Format and output results
     formatter = get_formatter(config.output_format)
@@ -105,8 +125,7 @@ def run_check(args):
 
     # Return exit code based on results
     # Return non-zero if there are errors
-    has_errors = any(d.level.value == "error" for d in all_diagnostics)
-    return 1 if has_errors else 0
+    return 1 if linter.by_level[DiagnosticLevel.ERROR] else 0
 
 
 if __name__ == "__main__":
@@ -1,7 +1,9 @@
 """Configuration management for ruff-linter-odoo."""
 
+import hashlib
+import re
 import sys
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, fields
 from pathlib import Path
 from typing import Optional
 
@@ -46,6 +48,25 @@ DEFAULT_ODOO_EXCEPTIONS = [
 ]
 
 
+# Settings that never change the diagnostics reported for a given file
+RESULT_NEUTRAL_SETTINGS = frozenset({"output_format", "jobs", "cache_dir", "exclude"})
+
+
+def compile_exclude_patterns(patterns: list[str]) -> re.Pattern:
+    """Compile exclude patterns into one regex matching anywhere in a path.
+
+    Plain patterns match as substrings; ``*`` and ``?`` behave as glob
+    wildcards within a single path component (e.g. ``*.egg-info``).
+    """
+    if not patterns:
+        return re.compile(r"(?!)")
+    parts = []
+    for pattern in patterns:
+        escaped = re.escape(pattern)
+        parts.append(escaped.replace(r"\*", r"[^/\\]*").replace(r"\?", r"[^/\\]"))
+    return re.compile("|".join(parts))
+
+
 @dataclass
 class Config:
     """Configuration for ruff-linter-odoo."""
@@ -56,6 +77,12 @@ class Config:
     # Output settings
     output_format: str = "text"  # text, json, sarif, github
 
+    # Parallelism: worker processes used to lint directories (None/0 = one per CPU)
+    jobs: Optional[int] = None
+
+    # Caching: directory of the on-disk results cache (None = no cache)
+    cache_dir: Optional[str] = None
+
     # Check settings
     enable: list[str] = field(default_factory=list)
     disable: list[str] = field(default_factory=list)
@@ -119,6 +146,8 @@ class Config:
         return cls(
             valid_odoo_versions=tool_config.get("valid-odoo-versions", default.valid_odoo_versions),
             output_format=tool_config.get("output-format", default.output_format),
+            jobs=tool_config.get("jobs", default.jobs),
+            cache_dir=tool_config.get("cache-dir", default.cache_dir),
             enable=tool_config.get("enable", default.enable),
             disable=tool_config.get("disable", default.disable),
             manifest_required_keys=tool_config.get("manifest-required-keys", default.manifest_required_keys),
@@ -133,6 +162,11 @@ class Config:
             exclude=tool_config.get("exclude", default.exclude),
         )
 
+    def cache_key(self) -> str:
+        """Digest of the settings that can change a file's diagnostics, for results caches."""
+        settings = [(f.name, getattr(self, f.name)) for f in fields(self) if f.name not in RESULT_NEUTRAL_SETTINGS]
+        return hashlib.sha256(repr(settings).encode()).hexdigest()
+
     def is_check_enabled(self, check_code: str) -> bool:
         """Check if a specific check is enabled."""
         if self.enable and check_code not in self.enable:
@@ -1,5 +1,6 @@
 """Diagnostic system for ruff-linter-odoo."""
 
+import sys
 from dataclasses import dataclass
 from enum import Enum
 from typing import Optional
@@ -15,7 +16,11 @@ class DiagnosticLevel(Enum):
     REFACTOR = "refactor"
 
 
-@dataclass
+# Slotted dataclasses need Python 3.10; diagnostics are allocated by the thousand
+_DATACLASS_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(**_DATACLASS_SLOTS)
 class Diagnostic:
     """Represents a linting diagnostic/violation."""
 
@@ -49,6 +54,39 @@ class Diagnostic:
             "fix": {"available": self.fix_available},
         }
 
+    def to_tuple(self) -> tuple:
+        """Return the fields as a flat tuple, in declaration order (level as its value).
+
+        Cheaper than `to_dict` for serializers that lay out the output themselves.
+        """
+        return (
+            self.code,
+            self.message,
+            self.filename,
+            self.line,
+            self.column,
+            self.level.value,
+            self.end_line,
+            self.end_column,
+            self.fix_available,
+        )
+
+    @classmethod
+    def from_tuple(cls, row: tuple) -> "Diagnostic":
+        """Build a diagnostic back from `to_tuple` output (e.g. sent by a worker process)."""
+        code, message, filename, line, column, level, end_line, end_column, fix_available = row
+        return cls(
+            sys.intern(code),
+            message,
+            sys.intern(filename),
+            line,
+            column,
+            DiagnosticLevel(level),
+            end_line,
+            end_column,
+            fix_available,
+        )
+
     def __str__(self):
         """Return a Ruff-compatible string representation."""
         return f"{self.filename}:{self.line}:{self.column}: {self.code} {self.message}"
@@ -1,13 +1,42 @@
 """Output formatters for ruff-linter-odoo."""
 
 import json
+from operator import attrgetter
 
 from . import __version__
-from .diagnostic import Diagnostic
+from .diagnostic import Diagnostic, DiagnosticLevel
+
+try:
+    import orjson
+except ImportError:  # optional: pip install ruff-linter-odoo[fast]
+    orjson = None
+
+
+def _dumps(data) -> str:
+    """Serialize to indented JSON, in C with orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2).decode()
+    return json.dumps(data, indent=2)
+
+
+# Sort key for text output: position order, extracted in C rather than a lambda
+_DIAGNOSTIC_POSITION = attrgetter("filename", "line", "column")
+
+# SARIF result level per diagnostic level, keyed by member to skip the `.value` lookup
+_SARIF_LEVELS = {
+    DiagnosticLevel.ERROR: "error",
+    DiagnosticLevel.WARNING: "warning",
+    DiagnosticLevel.INFO: "note",
+    DiagnosticLevel.CONVENTION: "note",
+    DiagnosticLevel.REFACTOR: "note",
+}
 
 
 class Formatter:
-    """Base class for output formatters."""
+    """Base class for output formatters.
+
+    Formatters must be stateless: `get_formatter` hands out shared instances.
+    """
 
     def format(self, diagnostics: list[Diagnostic]) -> str:
         """Format diagnostics for output."""
@@ -22,16 +51,10 @@ class TextFormatter(Formatter):
         if not diagnostics:
             return ""
 
-        lines = []
-        for diag in sorted(diagnostics, key=lambda d: (d.filename, d.line, d.column)):
-            lines.append(str(diag))
+        body = "\n".join(str(diag) for diag in sorted(diagnostics, key=_DIAGNOSTIC_POSITION))
 
         # Add summary
-        if diagnostics:
-            lines.append("")
-            lines.append(f"Found {len(diagnostics)} error(s).")
-
-        return "\n".join(lines)
+        return f"{body}\n\nFound {len(diagnostics)} error(s)."
 
 
 class JSONFormatter(Formatter):
@@ -39,8 +62,24 @@ class JSONFormatter(Formatter):
 
     def format(self, diagnostics: list[Diagnostic]) -> str:
         """Format diagnostics as JSON."""
-        output = [diag.to_dict() for diag in diagnostics]
-        return json.dumps(output, indent=2)
+        # Same layout as `Diagnostic.to_dict`, built inline from the flat fields
+        output = [
+            {
+                "code": code,
+                "message": message,
+                "filename": filename,
+                "location": {"row": line, "column": column},
+                "end_location": {"row": end_line or line, "column": end_column or column}
+                if end_line or end_column
+                else None,
+                "level": level,
+                "fix": {"available": fix_available},
+            }
+            for code, message, filename, line, column, level, end_line, end_column, fix_available in map(
+                Diagnostic.to_tuple, diagnostics
+            )
+        ]
+        return _dumps(output)
 
 
 class SARIFFormatter(Formatter):
@@ -64,21 +103,13 @@ class SARIFFormatter(Formatter):
                 }
             ],
         }
-        return json.dumps(sarif, indent=2)
+        return _dumps(sarif)
 
     def _to_sarif_result(self, diag: Diagnostic) -> dict:
         """Convert a diagnostic to a SARIF result."""
-        level_mapping = {
-            "error": "error",
-            "warning": "warning",
-            "info": "note",
-            "convention": "note",
-            "refactor": "note",
-        }
-
         return {
             "ruleId": diag.code,
-            "level": level_mapping.get(diag.level.value, "warning"),
+            "level": _SARIF_LEVELS[diag.level],
             "message": {"text": diag.message},
             "locations": [
                 {
@@ -103,24 +134,26 @@ class GitHubFormatter(Formatter):
         """Format diagnostics as GitHub Actions annotations."""
         lines = []
         for diag in diagnostics:
-            level = "error" if diag.level.value == "error" else "warning"
+            level = "error" if diag.level is DiagnosticLevel.ERROR else "warning"
             lines.append(
                 f"::{level} file={diag.filename},line={diag.line},col={diag.column},title={diag.code}::{diag.message}"
             )
         return "\n".join(lines)
 
 
+# Formatters hold no state, so one shared instance per format is enough
+_FORMATTERS: dict[str, Formatter] = {
+    "text": TextFormatter(),
+    "json": JSONFormatter(),
+    "sarif": SARIFFormatter(),
+    "github": GitHubFormatter(),
+}
+_UNKNOWN_FORMAT_HINT = f"Available formats: {', '.join(_FORMATTERS)}"
+
+
 def get_formatter(format_name: str) -> Formatter:
     """Get a formatter by name."""
-    formatters = {
-        "text": TextFormatter,
-        "json": JSONFormatter,
-        "sarif": SARIFFormatter,
-        "github": GitHubFormatter,
-    }
-
-    formatter_class = formatters.get(format_name.lower())
-    if formatter_class is None:
-        raise ValueError(f"Unknown format: {format_name}. Available formats: {', '.join(formatters.keys())}")
-
-    return formatter_class()
+    try:
+        return _FORMATTERS[format_name.lower()]
+    except KeyError:
+        raise ValueError(f"Unknown format: {format_name}. {_UNKNOWN_FORMAT_HINT}") from None
@@ -1,19 +1,86 @@
 """Core linter engine for ruff-linter-odoo."""
 
 import ast
+import contextlib
+import functools
+import hashlib
 import io
+import json
+import os
 import re
+import tempfile
 import tokenize
+from collections import deque
+from collections.abc import Iterator
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from itertools import islice
 from pathlib import Path
 from typing import Optional
 
-from .config import Config
-from .diagnostic import Diagnostic
-from .visitor import get_all_checkers
+from . import __version__
+from .checkers.odoo_checkers import find_module_dir
+from .config import Config, compile_exclude_patterns
+from .diagnostic import Diagnostic, DiagnosticLevel
+from .visitor import MANIFEST_CHECKER_FILES, FusedVisitor, get_all_checkers
 
 #: Ruff-style inline suppression: `# noqa` or `# noqa: OCA001, OCA002`
 NOQA_RE = re.compile(r"#\s*noqa(?::\s*(?P<codes>[A-Z][A-Z0-9]*(?:[,\s]+[A-Z][A-Z0-9]*)*))?", re.IGNORECASE)
 
+#: Below this many files a directory is linted in-process: starting the
+#: worker pool costs more than it saves.
+MIN_PARALLEL_FILES = 4
+
+#: Default upper bound on the number of files sent to a worker process at once.
+PARALLEL_BATCH_SIZE = 64
+
+#: In-process linting reads files ahead in this many threads, at most
+#: PREFETCH_AHEAD files ahead (well within the read cache).
+PREFETCH_THREADS = 8
+PREFETCH_AHEAD = 32
+
+#: Part of the on-disk results cache key: bump it whenever a check changes
+#: what it reports, so results cached by older checks are not reused.
+CHECKER_SUITE_VERSION = f"{__version__}-1"
+
+#: Files whose source is kept for re-lints of unchanged files (watch mode,
+#: config sweeps, tests) and read ahead by the prefetch threads. Trees are
+#: not kept: they are many times the size of the source.
+SOURCE_CACHE_SIZE = 256
+
+#: Per-process linter used by the worker pool (see `_init_worker`).
+_worker_linter: Optional["Linter"] = None
+
+
+@functools.lru_cache(maxsize=SOURCE_CACHE_SIZE)
+def _read_source(path: str, mtime_ns: int, size: int) -> Optional[str]:
+    """Read a source file (None if unreadable); mtime/size only key the cache."""
+    try:
+        with open(path, encoding="utf-8") as f:
+            return f.read()
+    except (OSError, UnicodeDecodeError):
+        return None
+
+
+def _prefetch_source(filepath: Path):
+    """Read a file into the source cache, for a prefetch thread."""
+    try:
+        stat = filepath.stat()
+    except OSError:
+        return
+    _read_source(str(filepath), stat.st_mtime_ns, stat.st_size)
+
+
+def _init_worker(config: Config):
+    """Build the worker's linter once, so the config is only sent once per process."""
+    global _worker_linter
+    _worker_linter = Linter(config)
+
+
+def _lint_batch_worker(filepaths: list[Path]) -> list[tuple]:
+    """Lint a batch of files inside a worker process, as flat diagnostic tuples (cheaper to pickle)."""
+    # Not recorded on the worker's linter: the parent records the rows it receives
+    return [diag.to_tuple() for filepath in filepaths for diag in _worker_linter._lint_file(filepath)]
+
 
 class Linter:
     """Main linter class that orchestrates the linting process."""
@@ -21,14 +88,48 @@ class Linter:
     def __init__(self, config: Optional[Config] = None):
         """Initialize the linter with optional configuration."""
         self.config = config or Config()
-        self.diagnostics: list[Diagnostic] = []
+        # Diagnostics reported so far, bucketed by level as results come in
+        self.by_level: dict[DiagnosticLevel, list[Diagnostic]] = {level: [] for level in DiagnosticLevel}
+        # Opt-in on-disk results cache (Config.cache_dir)
+        self._results_cache_dir = Path(self.config.cache_dir) if self.config.cache_dir else None
+        self._results_salt = f"{CHECKER_SUITE_VERSION}\0{self.config.cache_key()}\0".encode()
+        # Config.exclude compiled into one regex, once the config is final
+        self._exclude_re = compile_exclude_patterns(self.config.exclude)
 
     def lint_file(self, filepath: Path) -> list[Diagnostic]:
         """Lint a single Python file."""
+        return self._record(self._lint_file(filepath))
+
+    def _lint_file(self, filepath: Path) -> list[Diagnostic]:
+        """Lint a single Python file without recording its diagnostics on the linter."""
         try:
-            with open(filepath, encoding="utf-8") as f:
-                source_code = f.read()
-        except (OSError, UnicodeDecodeError):
+            stat = filepath.stat()
+        except OSError:
+            return []
+        # Reads are cached until the file's mtime or size changes
+        path = str(filepath)
+        source_code = _read_source(path, stat.st_mtime_ns, stat.st_size)
+        if source_code is None:
+            return []
+
+        # Manifest checks also look at other files (data files, README), so never cache them
+        results_key = None
+        if self._results_cache_dir is not None and filepath.name not in MANIFEST_CHECKER_FILES:
+            results_key = self._results_key(path, source_code)
+            cached = self._load_results(results_key)
+            if cached is not None:
+                return cached
+
+        diagnostics = self._check_source(filepath, source_code)
+        if results_key is not None:
+            self._store_results(results_key, diagnostics)
+        return diagnostics
+
+    def _check_source(self, filepath: Path, source_code: str) -> list[Diagnostic]:
+        """Run the checkers over a file's source."""
+        # Only checkers whose trigger names occur in the source; none -> nothing to parse
+        checkers = get_all_checkers(self.config, str(filepath), source_code)
+        if not checkers:
             return []
 
         try:
@@ -38,14 +139,63 @@ class Linter:
             return []
 
         file_diagnostics = []
-        checkers = get_all_checkers(self.config, str(filepath), source_code)
+        FusedVisitor(checkers).walk(tree)
 
         for checker in checkers:
-            checker.visit(tree)
             file_diagnostics.extend(checker.diagnostics)
 
         return self._filter_noqa(file_diagnostics, source_code)
 
+    def _results_key(self, path: str, source_code: str) -> str:
+        """Key of a file's cached results: its path, module and content, the settings and the checks."""
+        digest = hashlib.sha256(self._results_salt)
+        digest.update(path.encode("utf-8", "surrogateescape"))
+        digest.update(b"\0")
+        # Checks also depend on which Odoo module (if any) holds the file, e.g. OCA004
+        module_dir = find_module_dir(path)
+        digest.update(str(module_dir).encode("utf-8", "surrogateescape") if module_dir is not None else b"")
+        digest.update(b"\0")
+        digest.update(source_code.encode("utf-8", "surrogateescape"))
+        return digest.hexdigest()
+
+    def _load_results(self, key: str) -> Optional[list[Diagnostic]]:
+        """Cached results of a file (None on a miss or an unreadable entry)."""
+        try:
+            with open(self._results_cache_dir / key[:2] / f"{key}.json", encoding="utf-8") as f:
+                return [Diagnostic.from_tuple(row) for row in json.load(f)]
+        except (OSError, ValueError, TypeError):
+            return None
+
+    def _store_results(self, key: str, diagnostics: list[Diagnostic]):
+        """Cache the results of a file; failing to write only loses the cache entry."""
+        entry = self._results_cache_dir / key[:2] / f"{key}.json"
+        try:
+            entry.parent.mkdir(parents=True, exist_ok=True)
+            # Write then rename, so concurrent linters never read a partial entry
+            fd, tmp_path = tempfile.mkstemp(dir=entry.parent, suffix=".tmp")
+        except OSError:
+            return
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump([diag.to_tuple() for diag in diagnostics], f)
+            os.replace(tmp_path, entry)
+        except OSError:
+            # Do not leave the temporary file behind in the cache directory
+            with contextlib.suppress(OSError):
+                os.unlink(tmp_path)
+
+    @property
+    def error_count(self) -> int:
+        """Number of error-level diagnostics reported so far."""
+        return len(self.by_level[DiagnosticLevel.ERROR])
+
+    def _record(self, diagnostics: list[Diagnostic]) -> list[Diagnostic]:
+        """File the diagnostics of a linted file by level and return them."""
+        by_level = self.by_level
+        for diag in diagnostics:
+            by_level[diag.level].append(diag)
+        return diagnostics
+
     def _filter_noqa(self, diagnostics: list[Diagnostic], source_code: str) -> list[Diagnostic]:
         """Drop diagnostics suppressed by a `# noqa` comment on their line."""
         if "noqa" not in source_code:
@@ -83,19 +233,102 @@ class Linter:
         return noqa_lines
 
     def lint_directory(self, directory: Path, recursive: bool = True) -> list[Diagnostic]:
-        """Lint all Python files in a directory."""
+        """Lint all Python files in a directory (see `lint_paths`)."""
+        files = [
+            filepath
+            for filepath in self._iter_python_files(directory, recursive)
+            if not self._should_exclude(filepath)
+        ]
+        return self._lint_files(files)
+
+    def lint_paths(
+        self,
+        paths: list[Path],
+        workers: Optional[int] = None,
+        batch_size: int = PARALLEL_BATCH_SIZE,
+    ) -> list[Diagnostic]:
+        """Lint files and directories together, in path order.
+
+        Files are linted in batches of up to `batch_size` in parallel worker
+        processes (`workers`, defaulting to `Config.jobs`), falling back to
+        in-process linting (with threaded read-ahead) for a single worker or a
+        handful of files. Missing paths are skipped.
+        """
+        files = []
+        for path in paths:
+            if path.is_file():
+                files.append(path)
+            elif path.is_dir():
+                files.extend(
+                    filepath for filepath in self._iter_python_files(path) if not self._should_exclude(filepath)
+                )
+        return self._lint_files(files, workers, batch_size)
+
+    def _lint_files(
+        self,
+        files: list[Path],
+        workers: Optional[int] = None,
+        batch_size: int = PARALLEL_BATCH_SIZE,
+    ) -> list[Diagnostic]:
+        """Lint a list of files, in worker processes when it pays off."""
+        workers = min(workers or self.config.jobs or os.cpu_count() or 1, len(files))
+        if workers <= 1 or len(files) < MIN_PARALLEL_FILES:
+            return self._lint_files_in_process(files)
+
+        # Small enough batches to give every worker a share of the files
+        batch_size = max(1, min(batch_size, -(-len(files) // workers)))
+        batches = [files[start : start + batch_size] for start in range(0, len(files), batch_size)]
         all_diagnostics = []
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(self.config,)) as executor:
+            for rows in executor.map(_lint_batch_worker, batches):
+                # Recorded here: the workers' own linters are not this one
+                all_diagnostics.extend(self._record(list(map(Diagnostic.from_tuple, rows))))
+        return all_diagnostics
 
-        pattern = "**/*.py" if recursive else "*.py"
+    def _iter_python_files(self, directory: Path, recursive: bool = True) -> Iterator[Path]:
+        """Yield the Python files under a directory, depth first.
 
-        for filepath in directory.glob(pattern):
-            # Check if file should be excluded
-            if self._should_exclude(filepath):
+        A directory's files come before its subdirectories' files, each in
+        directory listing order (which the file system decides).
+        Subdirectories matching the exclude patterns are pruned without being
+        listed, and symlinked directories are not followed.
+        """
+        stack = [directory]
+        while stack:
+            current = stack.pop()
+            subdirs = []
+            try:
+                with os.scandir(current) as entries:
+                    for entry in entries:
+                        if entry.is_dir(follow_symlinks=False):
+                            if recursive:
+                                subdirs.append(entry.name)
+                        elif entry.name.endswith(".py") and entry.is_file():
+                            yield current / entry.name
+            except OSError:
                 continue
+            for name in reversed(subdirs):
+                subdir = current / name
+                if not self._should_exclude(subdir):
+                    stack.append(subdir)
 
-            diagnostics = self.lint_file(filepath)
-            all_diagnostics.extend(diagnostics)
+    def _lint_files_in_process(self, files: list[Path]) -> list[Diagnostic]:
+        """Lint files one by one, while threads read the upcoming ones from disk."""
+        all_diagnostics = []
+        if len(files) < 2:
+            for filepath in files:
+                all_diagnostics.extend(self.lint_file(filepath))
+            return all_diagnostics
 
+        upcoming = iter(files)
+        with ThreadPoolExecutor(max_workers=PREFETCH_THREADS) as executor:
+            reads = deque(executor.submit(_prefetch_source, filepath) for filepath in islice(upcoming, PREFETCH_AHEAD))
+            for filepath in files:
+                reads.popleft().result()
+                next_filepath = next(upcoming, None)
+                if next_filepath is not None:
+                    reads.append(executor.submit(_prefetch_source, next_filepath))
+                all_diagnostics.extend(self.lint_file(filepath))
         return all_diagnostics
 
     def lint_path(self, path: Path) -> list[Diagnostic]:
@@ -108,5 +341,4 @@ class Linter:
 
     def _should_exclude(self, filepath: Path) -> bool:
         """Check if a file should be excluded based on configuration."""
-        path_str = str(filepath)
-        return any(pattern in path_str for pattern in self.config.exclude)
+        return self._exclude_re.search(str(filepath)) is not None
@@ -1,21 +1,94 @@
 """AST visitor base classes and checker registry."""
 
 import ast
+import functools
+import os
+import re
+import sys
+from ast import AST
+from typing import Optional
 
 from .config import Config
 from .diagnostic import Diagnostic, DiagnosticLevel
 
+#: Manifest file names, checked by the ManifestChecker only.
+MANIFEST_CHECKER_FILES = frozenset({"__manifest__.py", "__openerp__.py"})
 
-class BaseChecker(ast.NodeVisitor):
-    """Base class for all AST-based checkers."""
+
+class BaseChecker:
+    """Base class for all AST-based checkers.
+
+    Checkers only implement `visit_<NodeType>` handlers, plus optional
+    `leave_<NodeType>` handlers called once the node's children have been
+    visited. Walking the tree is left to `FusedVisitor`, which drives every
+    checker of a file in a single traversal.
+
+    `CALL_FUNC_TYPES` restricts `visit_Call` to calls whose callee
+    (`node.func`) is one of the given node types; empty means any callee.
+    `TRIGGER_RE` matches the source of any file the checker could report
+    on; files it does not match skip the checker (None = always run).
+    """
+
+    CALL_FUNC_TYPES: tuple[type, ...] = ()
+    TRIGGER_RE: Optional[re.Pattern] = None
+
+    #: (prefix, node type, method name) of the class's handlers, except
+    #: `visit_Call`; filled in once per class when it is defined.
+    _handler_names: tuple[tuple[str, type, str], ...] = ()
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        names = {}
+        for klass in reversed(cls.__mro__):
+            for name in vars(klass):
+                if name.startswith(("visit_", "leave_")) and name != "visit_Call":
+                    names[name] = None
+        handlers = []
+        for name in names:
+            prefix, _, type_name = name.partition("_")
+            node_type = getattr(ast, type_name, None)
+            if isinstance(node_type, type) and issubclass(node_type, ast.AST):
+                handlers.append((prefix, node_type, name))
+        cls._handler_names = tuple(handlers)
 
     def __init__(self, config: Config, filename: str, source_code: str):
         """Initialize the checker."""
         self.config = config
-        self.filename = filename
+        # Shared by every diagnostic of the file, and across checkers and results cache hits
+        self.filename = sys.intern(filename)
         self.source_code = source_code
-        self.diagnostics: list[Diagnostic] = []
-        self.source_lines = source_code.splitlines()
+        # Reported diagnostics, one column per field; see `diagnostics`
+        self._codes: list[str] = []
+        self._messages: list[str] = []
+        self._lines: list[int] = []
+        self._columns: list[int] = []
+        self._levels: list[DiagnosticLevel] = []
+        self._end_lines: list[Optional[int]] = []
+        self._end_columns: list[Optional[int]] = []
+        # Code -> enabled by the config, resolved the first time the code is reported
+        self._code_enabled: dict[str, bool] = {}
+
+    @functools.cached_property
+    def source_lines(self) -> list[str]:
+        """Lines of the source, split on first use."""
+        return self.source_code.splitlines()
+
+    @property
+    def diagnostics(self) -> list[Diagnostic]:
+        """The diagnostics reported so far, built from the columns on each access."""
+        filename = self.filename
+        return [
+            Diagnostic(code, message, filename, line, column, level, end_line, end_column)
+            for code, message, line, column, level, end_line, end_column in zip(
+                self._codes,
+                self._messages,
+                self._lines,
+                self._columns,
+                self._levels,
+                self._end_lines,
+                self._end_columns,
+            )
+        ]
 
     def add_diagnostic(
         self,
@@ -25,24 +98,128 @@ class BaseChecker(ast.NodeVisitor):
         level: DiagnosticLevel = DiagnosticLevel.WARNING,
     ):
         """Add a diagnostic for a node."""
-        if not self.config.is_check_enabled(code):
+        enabled = self._code_enabled.get(code)
+        if enabled is None:
+            enabled = self._code_enabled[code] = self.config.is_check_enabled(code)
+        if not enabled:
             return
 
-        diagnostic = Diagnostic(
-            code=code,
-            message=message,
-            filename=self.filename,
-            line=node.lineno if hasattr(node, "lineno") else 1,
-            column=node.col_offset if hasattr(node, "col_offset") else 0,
-            level=level,
-            end_line=getattr(node, "end_lineno", None),
-            end_column=getattr(node, "end_col_offset", None),
-        )
-        self.diagnostics.append(diagnostic)
+        self._codes.append(code)
+        self._messages.append(message)
+        self._lines.append(getattr(node, "lineno", 1))
+        self._columns.append(getattr(node, "col_offset", 0))
+        self._levels.append(level)
+        self._end_lines.append(getattr(node, "end_lineno", None))
+        self._end_columns.append(getattr(node, "end_col_offset", None))
 
+    def visit_tree(self, tree: ast.AST):
+        """Run this checker alone over an already parsed tree.
 
-def get_all_checkers(config: Config, filename: str, source_code: str) -> list[BaseChecker]:
-    """Get all registered checkers."""
+        `Linter.lint_file` parses each file once and drives all of its checkers
+        through a single `FusedVisitor` walk of that tree instead.
+        """
+        FusedVisitor([self]).walk(tree)
+
+    # ast.NodeVisitor-style entry point
+    visit = visit_tree
+
+
+class FusedVisitor:
+    """Walk a tree once, dispatching each node to the handlers of all checkers.
+
+    The walk is an explicit stack loop rather than recursive `visit` calls,
+    visiting nodes in the same (pre-)order as `ast.NodeVisitor`. `visit_Call`
+    handlers are further dispatched on the callee's node type, so a checker
+    only sees the calls its `CALL_FUNC_TYPES` can match. Expression contexts
+    (Load/Store/Del) are only walked when some checker handles them.
+    """
+
+    def __init__(self, checkers: list[BaseChecker]):
+        """Collect the visit_/leave_ handlers of every checker, by node type."""
+        self._visit_handlers: dict[type, list] = {}
+        self._leave_handlers: dict[type, list] = {}
+        # visit_Call handlers by callee type, and those taking any callee
+        self._call_handlers: dict[type, list] = {}
+        self._any_call_handlers: list = []
+        for checker in checkers:
+            handler = getattr(checker, "visit_Call", None)
+            if handler is None:
+                continue
+            if not checker.CALL_FUNC_TYPES:
+                self._any_call_handlers.append(handler)
+                for handlers in self._call_handlers.values():
+                    handlers.append(handler)
+                continue
+            for func_type in checker.CALL_FUNC_TYPES:
+                self._call_handlers.setdefault(func_type, list(self._any_call_handlers)).append(handler)
+        for checker in checkers:
+            for prefix, node_type, name in checker._handler_names:
+                if prefix == "visit":
+                    self._visit_handlers.setdefault(node_type, []).append(getattr(checker, name))
+                else:
+                    self._leave_handlers.setdefault(node_type, []).append(getattr(checker, name))
+        # Load/Store/Del contexts hang off most expressions; only walk them if a checker handles one
+        handled_types = [*self._visit_handlers, *self._leave_handlers]
+        self._walk_ctx = any(issubclass(node_type, ast.expr_context) for node_type in handled_types)
+        # Node type -> names of the fields that may hold child nodes, filled in as types are met
+        self._child_fields: dict[type, tuple[str, ...]] = {}
+
+    def _fields_to_walk(self, node_type: type) -> tuple[str, ...]:
+        """Fields of a node type whose values are walked."""
+        if self._walk_ctx:
+            return node_type._fields
+        return tuple(field for field in node_type._fields if field != "ctx")
+
+    def walk(self, tree: ast.AST):
+        """Run the handlers of every node in the tree, visiting each node exactly once."""
+        visit_handler = self._visit_handlers.get
+        leave_handlers = self._leave_handlers
+        call_handler = self._call_handlers.get
+        any_call_handlers = self._any_call_handlers
+        child_fields = self._child_fields
+        call_type = ast.Call
+        # Items are nodes to visit, or (leave handlers, node) once its children are done
+        stack: list = [tree]
+        while stack:
+            node = stack.pop()
+            node_type = type(node)
+            if node_type is tuple:
+                handlers, node = node
+                for handler in handlers:
+                    handler(node)
+                continue
+            if node_type is call_type:
+                handlers = call_handler(type(node.func), any_call_handlers)
+            else:
+                handlers = visit_handler(node_type, ())
+            for handler in handlers:
+                handler(node)
+            if node_type in leave_handlers:
+                stack.append((leave_handlers[node_type], node))
+            # ast.iter_child_nodes, inlined: no generators on the hottest path
+            fields = child_fields.get(node_type)
+            if fields is None:
+                fields = child_fields[node_type] = self._fields_to_walk(node_type)
+            children = []
+            for field in fields:
+                value = getattr(node, field, None)
+                if isinstance(value, AST):
+                    children.append(value)
+                elif type(value) is list:
+                    for item in value:
+                        if isinstance(item, AST):
+                            children.append(item)
+            children.reverse()
+            stack.extend(children)
+
+
+@functools.lru_cache(maxsize=1)
+def _checker_classes() -> tuple[tuple[type[BaseChecker], ...], tuple[type[BaseChecker], ...]]:
+    """The (module, manifest) checker classes, imported on first use.
+
+    Resolved once: the checkers module imports this one, so it cannot be
+    imported at the top of this module.
+    """
     from .checkers.odoo_checkers import (
         CommitChecker,
         ImportChecker,
@@ -53,17 +230,27 @@ def get_all_checkers(config: Config, filename: str, source_code: str) -> list[Ba
         TranslationChecker,
     )
 
-    checker_classes = [
+    base_checkers = (
         PrintChecker,
         CommitChecker,
         SQLInjectionChecker,
         ImportChecker,
         MethodChecker,
         TranslationChecker,
-    ]
+    )
+    return base_checkers, (ManifestChecker,)
 
-    # Add manifest checker if this is a manifest file
-    if filename.endswith(("__manifest__.py", "__openerp__.py")):
-        checker_classes.append(ManifestChecker)
 
-    return [checker_class(config, filename, source_code) for checker_class in checker_classes]
+def get_all_checkers(config: Config, filename: str, source_code: str) -> list[BaseChecker]:
+    """Get the registered checkers that could report on this source.
+
+    An empty list means the file cannot produce a diagnostic and need not be parsed.
+    """
+    base_checkers, manifest_checkers = _checker_classes()
+    # Manifests are a bare dict literal: only the manifest checks apply to them
+    checker_classes = manifest_checkers if os.path.basename(filename) in MANIFEST_CHECKER_FILES else base_checkers
+    return [
+        checker_class(config, filename, source_code)
+        for checker_class in checker_classes
+        if checker_class.TRIGGER_RE is None or checker_class.TRIGGER_RE.search(source_code)
+    ]
@@ -2,12 +2,20 @@
 
 from __future__ import annotations
 
+import ast
+import json
+import os
+import sys
 import tempfile
 import unittest
+from collections import Counter
+from operator import attrgetter
 from pathlib import Path
 
-from ruff_linter_odoo import Linter
+from ruff_linter_odoo import Diagnostic, DiagnosticLevel, Linter
 from ruff_linter_odoo.config import Config
+from ruff_linter_odoo.formatters import get_formatter
+from ruff_linter_odoo.visitor import BaseChecker, get_all_checkers
 
 # Expected diagnostic counts from linting testing/resources/test_repo.
 #
@@ -61,6 +69,20 @@ EXPECTED_DIAGNOSTICS = {
 }
 
 
+def scan_python_files(root: Path) -> list[Path]:
+    """Sorted Python files under a directory, found with one os.scandir pass per directory."""
+    files = []
+    stack = [str(root)]
+    while stack:
+        with os.scandir(stack.pop()) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                elif entry.name.endswith(".py") and entry.is_file(follow_symlinks=False):
+                    files.append(Path(entry.path))
+    return sorted(files)
+
+
 class LintHelperMixin:
     """Helpers for linting inline source snippets."""
 
@@ -100,26 +122,36 @@ class LintHelperMixin:
 class MainTest(LintHelperMixin, unittest.TestCase):
     """Main test suite for ruff-linter-odoo."""
 
+    @classmethod
+    def setUpClass(cls):
+        """Set up test fixtures, linting the whole test repo once with the default config."""
+        super().setUpClass()
+        cls.root_path_modules = Path(__file__).parent.parent / "testing" / "resources" / "test_repo"
+        # Get all Python files in test repo (similar to pre-commit way)
+        cls.paths_modules = scan_python_files(cls.root_path_modules)
+        cls._baseline_diagnostics = cls._lint_paths(cls.paths_modules, Config(), check_exists=False)
+
     def setUp(self):
         """Set up test fixtures."""
-        self.root_path_modules = Path(__file__).parent.parent / "testing" / "resources" / "test_repo"
-        # Get all Python files in test repo (similar to pre-commit way)
-        self.paths_modules = sorted(self.root_path_modules.rglob("*.py"))
         self.maxDiff = None
 
     def run_linter(self, paths: list[Path] | None = None, config: Config | None = None) -> list:
-        """Run the linter on specified paths."""
+        """Run the linter on specified paths (the whole test repo by default)."""
+        if paths is None and config is None:
+            # A copy: tests may extend the list they get
+            return list(self._baseline_diagnostics)
         if paths is None:
-            paths = self.paths_modules
-
-        if config is None:
-            config = Config()
+            return self._lint_paths(self.paths_modules, config, check_exists=False)
+        return self._lint_paths(paths, config or Config())
 
+    @staticmethod
+    def _lint_paths(paths: list[Path], config: Config, check_exists: bool = True) -> list:
+        """Lint paths one by one, failing on a missing path unless they were just scanned."""
         linter = Linter(config)
         all_diagnostics = []
 
         for path in paths:
-            if not path.exists():
+            if check_exists and not path.exists():
                 raise OSError(f'Path "{path}" not found.')
 
             diagnostics = linter.lint_path(path)
@@ -129,10 +161,7 @@ class MainTest(LintHelperMixin, unittest.TestCase):
 
     def group_diagnostics_by_code(self, diagnostics: list) -> dict[str, int]:
         """Group diagnostics by code and return counts."""
-        counts = {}
-        for diag in diagnostics:
-            counts[diag.code] = counts.get(diag.code, 0) + 1
-        return counts
+        return Counter(map(attrgetter("code"), diagnostics))
 
     def test_10_path_dont_exist(self):
         """Test if path doesn't exist."""
@@ -192,6 +221,114 @@ class MainTest(LintHelperMixin, unittest.TestCase):
         for diag in diagnostics:
             self.assertIn("eleven_module", diag.filename)
 
+    def test_55_linter_directory_files(self):
+        """Test directory traversal finds the files glob does, pruning excluded directories."""
+        linter = Linter()
+        files = list(linter._iter_python_files(self.root_path_modules))
+        # Path.glob order differs between Python versions, so compare the file sets
+        expected = sorted(path for path in self.root_path_modules.glob("**/*.py") if not linter._should_exclude(path))
+        self.assertEqual(sorted(path for path in files if not linter._should_exclude(path)), expected)
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            root = Path(tmpdir)
+            (root / "__pycache__").mkdir()
+            (root / "__pycache__" / "cached.py").write_text('print("x")\n', encoding="utf-8")
+            (root / "pkg").mkdir()
+            (root / "pkg" / "nested.py").write_text('print("x")\n', encoding="utf-8")
+            (root / "top.py").write_text('print("x")\n', encoding="utf-8")
+            self.assertEqual(list(linter._iter_python_files(root)), [root / "top.py", root / "pkg" / "nested.py"])
+            self.assertEqual(list(linter._iter_python_files(root, recursive=False)), [root / "top.py"])
+
+    def test_60_linter_directory_parallel(self):
+        """Test parallel directory linting matches in-process linting."""
+        serial = self.run_linter([self.root_path_modules], config=Config(jobs=1))
+        parallel = self.run_linter([self.root_path_modules], config=Config(jobs=2))
+        self.assertTrue(serial)
+        self.assertEqual(parallel, serial)
+
+    def test_61_lint_paths_batches(self):
+        """Test batched multi-path linting matches per-path linting, in path order."""
+        paths = [*self.paths_modules[:5], self.root_path_modules / "eleven_module", self.root_path_modules / "missing"]
+        per_path = self.run_linter(paths[:-1], config=Config(jobs=1))
+        self.assertTrue(per_path)
+        for workers in (1, 2):
+            self.assertEqual(Linter().lint_paths(paths, workers=workers, batch_size=3), per_path)
+
+    def test_62_linter_error_count(self):
+        """Test the linter counts error-level diagnostics, in-process and in worker processes."""
+        for jobs in (1, 2):
+            linter = Linter(Config(jobs=jobs))
+            diagnostics = linter.lint_path(self.root_path_modules)
+            expected = sum(1 for diag in diagnostics if diag.level is DiagnosticLevel.ERROR)
+            self.assertTrue(expected)
+            self.assertEqual(linter.error_count, expected)
+            self.assertEqual(sum(map(len, linter.by_level.values())), len(diagnostics))
+
+    def test_65_relint_modified_file(self):
+        """Test re-linting a file picks up its changes despite the source cache."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = Path(tmpdir) / "module_file.py"
+            path.write_text('print("x")\n', encoding="utf-8")
+            self.assertEqual(self.codes(Linter().lint_file(path)), ["OCA001"])
+            path.write_text('_logger.info("x")\n', encoding="utf-8")
+            self.assertEqual(self.codes(Linter().lint_file(path)), [])
+
+    def test_66_results_cache(self):
+        """Test the on-disk results cache reuses results of unchanged files only."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            config = Config(cache_dir=str(Path(tmpdir) / "cache"))
+            path = Path(tmpdir) / "module_file.py"
+            path.write_text('print("x")\n', encoding="utf-8")
+            first = Linter(config).lint_file(path)
+            self.assertEqual(self.codes(first), ["OCA001"])
+            self.assertEqual(len(list((Path(tmpdir) / "cache").rglob("*.json"))), 1)
+            self.assertEqual(Linter(config).lint_file(path), first)
+
+            path.write_text('print("x")\nprint("y")\n', encoding="utf-8")
+            self.assertEqual(self.codes(Linter(config).lint_file(path)), ["OCA001", "OCA001"])
+            # Settings that change the results are part of the key
+            self.assertEqual(Linter(Config(cache_dir=config.cache_dir, disable=["OCA001"])).lint_file(path), [])
+
+            # So is the module holding the file: adding its manifest later changes OCA004
+            module_dir = Path(tmpdir) / "my_mod"
+            module_dir.mkdir()
+            path = module_dir / "models.py"
+            path.write_text("from odoo.addons.my_mod import models\n", encoding="utf-8")
+            self.assertEqual(Linter(config).lint_file(path), [])
+            (module_dir / "__manifest__.py").write_text('{"name": "My Module"}\n', encoding="utf-8")
+            self.assertEqual(self.codes(Linter(config).lint_file(path)), ["OCA004"])
+
+            # An entry that cannot be written leaves no temporary file behind
+            linter = Linter(config)
+            path.write_text('print("z")\n', encoding="utf-8")
+            key = linter._results_key(str(path), path.read_text(encoding="utf-8"))
+            (Path(config.cache_dir) / key[:2] / f"{key}.json" / "blocker").mkdir(parents=True)
+            self.assertEqual(self.codes(linter.lint_file(path)), ["OCA001"])
+            self.assertEqual(list(Path(config.cache_dir).rglob("*.tmp")), [])
+
+    def test_67_checkers_gated_by_trigger_names(self):
+        """Test only checkers whose trigger names occur in the source are built."""
+        config = Config()
+        self.assertEqual(get_all_checkers(config, "models.py", "x = 1\n"), [])
+        checkers = get_all_checkers(config, "models.py", 'print("x")\n')
+        self.assertEqual([type(checker).__name__ for checker in checkers], ["PrintChecker"])
+        checkers = get_all_checkers(config, "__manifest__.py", "{}\n")
+        self.assertEqual([type(checker).__name__ for checker in checkers], ["ManifestChecker"])
+        # Manifests only get the manifest checks, whatever names they contain
+        checkers = get_all_checkers(config, os.path.join("my_module", "__openerp__.py"), '{"name": print}\n')
+        self.assertEqual([type(checker).__name__ for checker in checkers], ["ManifestChecker"])
+
+    def test_68_expression_contexts_walked_when_handled(self):
+        """Test Load/Store nodes still reach a checker that handles them."""
+
+        class ContextChecker(BaseChecker):
+            def visit_Store(self, node):
+                self.add_diagnostic("CTX001", "store", node)
+
+        checker = ContextChecker(Config(), "a.py", "")
+        checker.visit_tree(ast.parse("x = y = z\n"))
+        self.assertEqual(self.codes(checker.diagnostics), ["CTX001", "CTX001"])
+
     def test_70_config_from_file(self):
         """Test loading configuration from pyproject.toml."""
         config_path = Path(__file__).parent.parent / "pyproject.toml"
@@ -215,6 +352,13 @@ class MainTest(LintHelperMixin, unittest.TestCase):
             self.assertIn(str(diag.line), diag_str)
             self.assertIn(":", diag_str)
 
+    @unittest.skipIf(sys.version_info < (3, 10), "slotted dataclasses need Python 3.10")
+    def test_85_diagnostic_slots(self):
+        """Test diagnostics are slotted: no per-instance __dict__."""
+        diag = Diagnostic("OCA001", "message", "f.py", 1, 0, DiagnosticLevel.WARNING)
+        self.assertFalse(hasattr(diag, "__dict__"))
+        self.assertEqual(Diagnostic.from_tuple(diag.to_tuple()), diag)
+
     def test_90_exclude_patterns(self):
         """Test that exclude patterns work."""
         config = Config(exclude=[".git", "__pycache__", "migrations"])
@@ -223,6 +367,20 @@ class MainTest(LintHelperMixin, unittest.TestCase):
         self.assertTrue(linter._should_exclude(Path("/some/module/migrations/file.py")))
         self.assertFalse(linter._should_exclude(Path("/some/module/models.py")))
 
+        # Exclude patterns set after the config is created still apply
+        config = Config()
+        config.exclude = ["sub"]
+        self.assertTrue(Linter(config)._should_exclude(Path("/x/sub/a.py")))
+
+    def test_91_exclude_glob_patterns(self):
+        """Test that glob wildcards in exclude patterns stay within one path component."""
+        linter = Linter(Config(exclude=["*.egg-info"]))
+        self.assertTrue(linter._should_exclude(Path("/src/my_module.egg-info/setup.py")))
+        self.assertFalse(linter._should_exclude(Path("/src/my_module.egg/info.py")))
+
+        linter = Linter(Config(exclude=[]))
+        self.assertFalse(linter._should_exclude(Path("/some/module/models.py")))
+
     def test_95_diagnostic_to_dict(self):
         """Test diagnostic serialization to dict."""
         diagnostics = self.run_linter()
@@ -240,6 +398,13 @@ class MainTest(LintHelperMixin, unittest.TestCase):
             self.assertIn("row", diag_dict["location"])
             self.assertIn("column", diag_dict["location"])
 
+    def test_96_json_output_matches_to_dict(self):
+        """Test the JSON formatter lays diagnostics out exactly like `to_dict`."""
+        diagnostics = self.run_linter()
+        diagnostics.append(Diagnostic("OCA999", "ranged", "f.py", 1, 2, DiagnosticLevel.ERROR, end_line=3))
+        output = json.loads(get_formatter("json").format(diagnostics))
+        self.assertEqual(output, [diag.to_dict() for diag in diagnostics])
+
 
 class NoqaTest(LintHelperMixin, unittest.TestCase):
     """Tests for ruff-style `# noqa` inline suppression."""
@@ -271,6 +436,7 @@ class PythonRulesTest(LintHelperMixin, unittest.TestCase):
 
     def test_oca001_print_used(self):
         self.assert_code('print("hello")\n', "OCA001")
+        self.assert_code('print ("hello")\n', "OCA001")
         self.assert_no_code('_logger.info("hello")\n', "OCA001")
 
     def test_oca002_invalid_commit(self):
@@ -362,6 +528,20 @@ class PythonRulesTest(LintHelperMixin, unittest.TestCase):
         # Plain functions (not methods) are fine
         self.assert_no_code("def create(vals):\n    return vals\n", "OCA007")
 
+    def test_oca007_reported_in_class_order(self):
+        """Test a class's OCA007 diagnostics come before the diagnostics inside its body."""
+        diagnostics = self.lint_source(
+            "class MyModel(models.Model):\n"
+            '    _name = "my.model"\n'
+            "    def write(self, vals):\n"
+            "        return vals\n"
+            '    name = fields.Char(compute="bad")\n'
+            "    class Nested:\n"
+            "        def create(self, vals):\n"
+            "            return vals\n"
+        )
+        self.assertEqual([(d.code, d.line) for d in diagnostics], [("OCA007", 3), ("OCA006", 5), ("OCA007", 7)])
+
     def test_oca008_translation_not_lazy(self):
         self.assert_code("def m(self, name):\n    msg = _('Hello %s' % name)\n", "OCA008")
         self.assert_code("def m(self, name):\n    msg = _('Hello %s') % name\n", "OCA008")